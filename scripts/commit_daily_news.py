@@ -2,6 +2,14 @@
 import subprocess
 from datetime import datetime, timedelta, timezone
 
+# Identity passed with -c so no separate `git config` processes are needed
+GIT_IDENTITY = [
+    "-c",
+    "user.name=github-actions[bot]",
+    "-c",
+    "user.email=github-actions[bot]@users.noreply.github.com",
+]
+
 
 def run(cmd: list[str]) -> None:
     subprocess.run(cmd, check=True)
@@ -11,16 +19,18 @@ def main() -> int:
     report_date = (datetime.now(tz=timezone.utc).date() - timedelta(days=1)).isoformat()
     filename = f"{report_date}.md"
 
-    run(["git", "config", "user.name", "github-actions[bot]"])
-    run(["git", "config", "user.email", "github-actions[bot]@users.noreply.github.com"])
-
-    run(["git", "add", filename])
-    diff = subprocess.run(["git", "diff", "--cached", "--quiet"])
-    if diff.returncode == 0:
+    status = subprocess.run(
+        ["git", "status", "--porcelain", "--", filename],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    if not status.stdout.strip():
         print("No changes to commit.")
         return 0
 
-    run(["git", "commit", "-m", f"Add daily news for {filename}"])
+    run(["git", "add", filename])
+    run(["git", *GIT_IDENTITY, "commit", "-m", f"Add daily news for {filename}"])
     run(["git", "push"])
     return 0
 
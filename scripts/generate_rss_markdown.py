@@ -1,44 +1,83 @@
 #!/usr/bin/env python3
 import argparse
-import gzip
+import base64
+import functools
+import hashlib
+import io
 import json
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from html import unescape
-from typing import Any, Dict, List, Optional, Sequence, Tuple
-from urllib.parse import quote_plus, urlparse
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
-import xml.etree.ElementTree as ET
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+from urllib.parse import quote, urlparse
+
+import urllib3
+from lxml import etree as ET
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # stdlib json accepts bytes too, just slower
+    from json import loads as _json_loads
+
+# Shared connection pool so repeated hits on the same host reuse keep-alive sockets
+_POOL = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=16,
+    retries=urllib3.Retry(connect=2, read=2, redirect=10, backoff_factor=0.3),
+)
+
+_YT_CHANNEL_RE = re.compile(rb"UC[a-zA-Z0-9_-]{20,}")
+_DT_MIN = datetime.min
+_SHARE_PREFIX = "https://bsky.app/intent/compose?text="
+
+# On-disk HTTP cache used for conditional GETs; persisted between CI runs
+_CACHE_DIR = os.environ.get("NEWS_CACHE_DIR", "cache")
 
 
 def _local(tag: str) -> str:
+    # lxml exposes comments and processing instructions with non-string tags
+    if not isinstance(tag, str):
+        return ""
     return tag.split("}", 1)[-1] if "}" in tag else tag
 
 
-def _child_text(el: ET.Element, name: str) -> Optional[str]:
+def _collect(el: ET._Element, names: FrozenSet[str]) -> Dict[str, str]:
+    """Return the stripped text of the first child for each wanted tag, in one pass."""
+    out: Dict[str, str] = {}
     for child in el:
-        if _local(child.tag) == name:
-            return (child.text or "").strip()
-    return None
+        name = _local(child.tag)
+        if name in names and name not in out:
+            out[name] = (child.text or "").strip()
+    return out
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_date(text: Optional[str]) -> Optional[datetime]:
     if not text:
         return None
+    text = text.strip()
+    # Atom feeds use ISO 8601; skip the RFC 2822 parser for those
+    if len(text) >= 10 and text[4] == "-" and text[7] == "-":
+        try:
+            return datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            pass
     try:
         return parsedate_to_datetime(text)
     except Exception:
-        try:
-            return datetime.fromisoformat(text.replace("Z", "+00:00"))
-        except Exception:
-            return None
+        return None
 
 
-def _open_url(url: str):
+def _open_url(
+    url: str,
+    extra_headers: Optional[Dict[str, str]] = None,
+    preload_content: bool = True,
+) -> urllib3.BaseHTTPResponse:
     parsed = urlparse(url)
     headers = {
         # Closer to a recent Chrome UA; avoid custom suffixes that trigger WAFs
@@ -54,44 +93,139 @@ def _open_url(url: str):
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if parsed.netloc.endswith("github.com") and token:
         headers["Authorization"] = f"Bearer {token}"
-    req = Request(url, headers=headers)
+    if extra_headers:
+        headers.update(extra_headers)
     timeout = float(os.environ.get("NEWS_FETCH_TIMEOUT", "15"))
-    return urlopen(req, timeout=timeout)
+    return _POOL.request(
+        "GET",
+        url,
+        headers=headers,
+        timeout=urllib3.Timeout(connect=min(5.0, timeout), read=timeout),
+        preload_content=preload_content,
+    )
 
 
-def _read_body(resp) -> bytes:
-    data = resp.read()
-    encoding = (resp.headers.get("Content-Encoding") or "").lower()
-    if "gzip" in encoding:
-        try:
-            data = gzip.decompress(data)
-        except Exception:
-            pass
+def _read_prefix(resp: urllib3.BaseHTTPResponse, max_bytes: int) -> bytes:
+    try:
+        return resp.read(max_bytes)
+    finally:
+        # Drop the half-read connection instead of returning it to the pool
+        resp.close()
+        resp.release_conn()
+
+
+def _cache_path(url: str) -> str:
+    return os.path.join(_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _load_cached_response(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_cache_path(url), "rb") as f:
+            data = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or not data.get("body_b64"):
+        return None
     return data
 
 
-def _fetch_bytes(url: str) -> Tuple[Optional[bytes], Optional[str]]:
+def _write_cache_file(path: str, data: Any) -> None:
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _store_cached_response(url: str, resp: urllib3.BaseHTTPResponse, body: bytes) -> None:
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
     try:
-        with _open_url(url) as resp:
-            return _read_body(resp), None
-    except HTTPError as e:
-        reason = f"{e.code} {e.reason}".strip()
-        print(f"warning: could not fetch {url} ({reason})", file=sys.stderr)
-        return None, reason
-    except URLError as e:
+        _write_cache_file(
+            _cache_path(url),
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body_b64": base64.b64encode(body).decode("ascii"),
+            },
+        )
+    except OSError as e:
+        print(f"warning: could not cache {url}: {e}", file=sys.stderr)
+
+
+def _fetch_bytes(url: str, max_bytes: Optional[int] = None) -> Tuple[Optional[bytes], Optional[str]]:
+    # Truncated reads are neither cached nor revalidated
+    cached = _load_cached_response(url) if max_bytes is None else None
+    conditional: Dict[str, str] = {}
+    if cached:
+        if cached.get("etag"):
+            conditional["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            conditional["If-Modified-Since"] = cached["last_modified"]
+    try:
+        resp = _open_url(url, conditional, preload_content=max_bytes is None)
+        body = resp.data if max_bytes is None else _read_prefix(resp, max_bytes)
+    except urllib3.exceptions.MaxRetryError as e:
         print(f"warning: could not fetch {url} ({e.reason})", file=sys.stderr)
         return None, str(e.reason)
     except Exception as e:
         print(f"warning: could not fetch {url}: {e}", file=sys.stderr)
         return None, str(e)
+    if resp.status == 304 and cached:
+        return base64.b64decode(cached["body_b64"]), None
+    if resp.status >= 400:
+        reason = f"{resp.status} {resp.reason or ''}".strip()
+        print(f"warning: could not fetch {url} ({reason})", file=sys.stderr)
+        return None, reason
+    if max_bytes is None:
+        _store_cached_response(url, resp, body)
+    return body, None
+
+
+def _fetch_json(url: str) -> Any:
+    resp = _open_url(url)
+    if resp.status >= 400:
+        raise RuntimeError(f"{url} returned {resp.status} {resp.reason or ''}".strip())
+    return _json_loads(resp.data)
+
+
+def _strip_tags(text: str) -> str:
+    # Linear scan instead of a regex: no backtracking on stray "<" in feed bodies
+    out: List[str] = []
+    i = 0
+    while True:
+        j = text.find("<", i)
+        if j < 0:
+            out.append(text[i:])
+            break
+        out.append(text[i:j])
+        k = text.find(">", j + 1)
+        if k < 0:
+            # Unclosed "<" is kept as literal text
+            out.append(text[j:])
+            break
+        i = k + 1
+    return " ".join(out)
+
+
+def _collapse_whitespace(text: str) -> str:
+    # Every whitespace character except " " is non-printable, so clean
+    # single-line text can skip the split/join round trip
+    if text.isprintable() and "  " not in text:
+        return text.strip()
+    return " ".join(text.split())
 
 
 def _clean_text(text: Optional[str]) -> str:
     if not text:
         return ""
     text = unescape(text)
-    text = re.sub(r"<[^>]+>", " ", text)
-    return " ".join(text.split()).strip()
+    if "<" in text:
+        text = _strip_tags(text)
+    return _collapse_whitespace(text)
 
 
 def _parse_list_url(list_url: str) -> Dict[str, str]:
@@ -104,8 +238,7 @@ def _parse_list_url(list_url: str) -> Dict[str, str]:
 
 def _resolve_handle(handle: str) -> str:
     url = f"https://public.api.bsky.app/xrpc/com.atproto.identity.resolveHandle?handle={handle}"
-    with _open_url(url) as resp:
-        data = json.loads(_read_body(resp).decode("utf-8"))
+    data = _fetch_json(url)
     did = data.get("did")
     if not did:
         raise ValueError(f"Could not resolve handle: {handle}")
@@ -117,8 +250,7 @@ def _fetch_list_members(list_url: str) -> List[Dict[str, str]]:
     did = _resolve_handle(info["handle"])
     list_uri = f"at://{did}/app.bsky.graph.list/{info['list_id']}"
     api_url = f"https://public.api.bsky.app/xrpc/app.bsky.graph.getList?list={list_uri}"
-    with _open_url(api_url) as resp:
-        data = json.loads(_read_body(resp).decode("utf-8"))
+    data = _fetch_json(api_url)
     members: List[Dict[str, str]] = []
     for item in data.get("items", []):
         subject = item.get("subject") or {}
@@ -136,9 +268,35 @@ def _fetch_list_members(list_url: str) -> List[Dict[str, str]]:
     return members
 
 
+def _load_list_members(list_url: str) -> List[Dict[str, str]]:
+    """Return list members, reusing the on-disk copy while it is fresher than the TTL."""
+    cache_path = os.path.join(_CACHE_DIR, "list_members.json")
+    ttl = float(os.environ.get("NEWS_LIST_CACHE_TTL", "86400"))
+    now = datetime.now(tz=timezone.utc).timestamp()
+    try:
+        with open(cache_path, "rb") as f:
+            cached = _json_loads(f.read())
+    except (OSError, ValueError):
+        cached = None
+    if (
+        isinstance(cached, dict)
+        and cached.get("list_url") == list_url
+        and isinstance(cached.get("fetched_at"), (int, float))
+        and 0 <= now - cached["fetched_at"] < ttl
+        and isinstance(cached.get("members"), list)
+    ):
+        return cached["members"]
+    members = _fetch_list_members(list_url)
+    try:
+        _write_cache_file(cache_path, {"fetched_at": now, "list_url": list_url, "members": members})
+    except OSError as e:
+        print(f"warning: could not cache list members: {e}", file=sys.stderr)
+    return members
+
+
 def _load_github_repos(path: str) -> List[str]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = _json_loads(f.read())
     if isinstance(data, dict):
         data = [data]
     if not isinstance(data, list):
@@ -157,94 +315,119 @@ def _load_github_repos(path: str) -> List[str]:
     return repos
 
 
-def _parse_rss_items(root: ET.Element) -> List[Dict[str, Any]]:
-    items: List[Dict[str, Any]] = []
-    channel = None
-    for child in root:
-        if _local(child.tag) == "channel":
-            channel = child
-            break
-    if channel is None:
-        return items
-    for item in channel:
-        if _local(item.tag) != "item":
-            continue
-        title = _child_text(item, "title") or "Untitled"
-        link = _child_text(item, "link") or ""
-        pub_date = _parse_date(_child_text(item, "pubDate"))
-        description = _child_text(item, "description")
-        content = _child_text(item, "encoded")
-        message = _clean_text(description or content or title) or "Untitled"
-        items.append({"title": title, "message": message, "link": link, "date": pub_date})
-    return items
-
-
-def _parse_feed_title(root: ET.Element) -> Optional[str]:
-    root_name = _local(root.tag)
-    if root_name == "rss":
-        for child in root:
-            if _local(child.tag) == "channel":
-                return _child_text(child, "title")
-    if root_name == "feed":
-        return _child_text(root, "title")
-    return None
-
-
-def _parse_atom_entries(root: ET.Element) -> List[Dict[str, Any]]:
+_RSS_FIELDS = frozenset({"title", "link", "pubDate", "description", "encoded"})
+_ATOM_FIELDS = frozenset({"title", "updated", "published", "summary", "content"})
+
+
+def _parse_rss_item(item: ET._Element) -> Dict[str, Any]:
+    fields = _collect(item, _RSS_FIELDS)
+    title = fields.get("title") or "Untitled"
+    link = fields.get("link") or ""
+    pub_date = _parse_date(fields.get("pubDate"))
+    description = fields.get("description")
+    content = fields.get("encoded")
+    message = _clean_text(description or content or title) or "Untitled"
+    return {"title": title, "message": message, "link": link, "date": pub_date}
+
+
+def _parse_atom_entry(entry: ET._Element) -> Dict[str, Any]:
+    fields: Dict[str, str] = {}
+    link = ""
+    alternate = False
+    for child in entry:
+        name = _local(child.tag)
+        if name == "link":
+            href = child.attrib.get("href")
+            if href and not alternate:
+                if child.attrib.get("rel", "alternate") == "alternate":
+                    link = href
+                    alternate = True
+                elif not link:
+                    link = href
+        elif name in _ATOM_FIELDS and name not in fields:
+            fields[name] = (child.text or "").strip()
+    title = fields.get("title") or "Untitled"
+    date = _parse_date(fields.get("updated") or fields.get("published"))
+    summary = fields.get("summary")
+    content = fields.get("content")
+    message = _clean_text(summary or content or title) or "Untitled"
+    return {"title": title, "message": message, "link": link, "date": date}
+
+
+def _parse_feed(xml_bytes: bytes) -> List[Dict[str, Any]]:
+    return _parse_feed_with_title(xml_bytes)[1]
+
+
+def _parse_feed_with_title(
+    xml_bytes: bytes, since: Optional[datetime] = None
+) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    return _parse_feed_stream(xml_bytes, since)
+
+
+def _ancestors(elem: ET._Element) -> List[str]:
+    names: List[str] = []
+    parent = elem.getparent()
+    while parent is not None:
+        names.append(_local(parent.tag))
+        parent = parent.getparent()
+    names.reverse()
+    return names
+
+
+def _parse_feed_stream(
+    xml_bytes: bytes, since: Optional[datetime] = None
+) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """Stream-parse an RSS or Atom feed, one item/entry at a time.
+
+    When ``since`` is given and the entries seen so far are newest-first,
+    parsing stops at the first entry older than ``since``; the remaining
+    entries cannot fall inside the window.
+    """
+    title: Optional[str] = None
     entries: List[Dict[str, Any]] = []
-    for entry in root:
-        if _local(entry.tag) != "entry":
+    prev_date: Optional[datetime] = None
+    descending = True
+    # libxml2 skips every element except the three tags we care about
+    for _, elem in ET.iterparse(
+        io.BytesIO(xml_bytes),
+        events=("end",),
+        tag=("{*}title", "{*}item", "{*}entry"),
+        recover=True,
+        huge_tree=False,
+    ):
+        name = _local(elem.tag)
+        path = _ancestors(elem)
+        if name == "title":
+            if title is None and (path == ["rss", "channel"] or path == ["feed"]):
+                title = (elem.text or "").strip()
+            continue
+        if name == "item" and len(path) == 2 and path[-1] == "channel":
+            entry = _parse_rss_item(elem)
+        elif name == "entry" and len(path) == 1:
+            entry = _parse_atom_entry(elem)
+        else:
+            continue
+        elem.clear()
+        entries.append(entry)
+        date = entry["date"]
+        if since is None or not isinstance(date, datetime):
             continue
-        title = _child_text(entry, "title") or "Untitled"
-        link = ""
-        for link_el in entry:
-            if _local(link_el.tag) != "link":
-                continue
-            rel = link_el.attrib.get("rel", "alternate")
-            if rel == "alternate" and link_el.attrib.get("href"):
-                link = link_el.attrib["href"]
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        if prev_date is not None:
+            if date > prev_date:
+                descending = False
+            elif descending and date < since:
                 break
-            if not link and link_el.attrib.get("href"):
-                link = link_el.attrib["href"]
-        date = _parse_date(_child_text(entry, "updated") or _child_text(entry, "published"))
-        summary = _child_text(entry, "summary")
-        content = _child_text(entry, "content")
-        message = _clean_text(summary or content or title) or "Untitled"
-        entries.append({"title": title, "message": message, "link": link, "date": date})
-    return entries
+        prev_date = date
+    return title, entries
 
 
-def _parse_feed(xml_bytes: bytes) -> List[Dict[str, Any]]:
-    root = ET.fromstring(xml_bytes)
-    root_name = _local(root.tag)
-    if root_name == "rss":
-        return _parse_rss_items(root)
-    if root_name == "feed":
-        return _parse_atom_entries(root)
-    # Fallback: try to find items or entries anywhere
-    items = root.findall(".//item")
-    if items:
-        return _parse_rss_items(root)
-    return _parse_atom_entries(root)
-
-
-def _parse_feed_with_title(xml_bytes: bytes) -> Tuple[Optional[str], List[Dict[str, Any]]]:
-    root = ET.fromstring(xml_bytes)
-    title = _parse_feed_title(root)
-    root_name = _local(root.tag)
-    if root_name == "rss":
-        return title, _parse_rss_items(root)
-    if root_name == "feed":
-        return title, _parse_atom_entries(root)
-    items = root.findall(".//item")
-    if items:
-        return title, _parse_rss_items(root)
-    return title, _parse_atom_entries(root)
-
-
-def _safe_parse_feed_with_title(xml_bytes: bytes, source: str) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+def _safe_parse_feed_with_title(
+    xml_bytes: bytes, source: str, since: Optional[datetime] = None
+) -> Tuple[Optional[str], List[Dict[str, Any]]]:
     try:
-        return _parse_feed_with_title(xml_bytes)
+        return _parse_feed_with_title(xml_bytes, since)
     except ET.ParseError as e:
         print(f"warning: could not parse feed for {source}: {e}", file=sys.stderr)
     except Exception as e:
@@ -262,29 +445,37 @@ def _yesterday_range_utc() -> Dict[str, datetime]:
 
 def _filter_previous_day(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     window = _yesterday_range_utc()
+    start_ts = window["start"].timestamp()
+    end_ts = window["end"].timestamp()
     filtered: List[Dict[str, Any]] = []
+    prev_ts: Optional[float] = None
+    descending = True
     for entry in entries:
         dt = entry.get("date")
         if not isinstance(dt, datetime):
             continue
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
-        utc_dt = dt.astimezone(timezone.utc)
-        if window["start"] <= utc_dt <= window["end"]:
+        ts = dt.timestamp()
+        if start_ts <= ts <= end_ts:
             filtered.append(entry)
+        if prev_ts is not None:
+            if ts > prev_ts:
+                descending = False
+            elif descending and ts < start_ts:
+                # Newest-first feed: everything after this is older still
+                break
+        prev_ts = ts
     return filtered
 
 
 def _latest_entry(entries: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    if not entries:
-        return None
-    sorted_entries = sorted(entries, key=lambda e: e.get("date") or datetime.min, reverse=True)
-    return sorted_entries[0]
+    return max(entries, key=lambda e: e.get("date") or _DT_MIN, default=None)
 
 
 def _load_blog_feeds(path: str) -> List[Dict[str, str]]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = _json_loads(f.read())
     feeds: List[Dict[str, str]] = []
 
     # Support new grouped shape: { "tag": ["url", {...}] }
@@ -337,37 +528,67 @@ def _extract_youtube_channel_id(url: str) -> str:
     parts = [p for p in parsed.path.split("/") if p]
     if len(parts) >= 2 and parts[0] == "channel":
         return parts[1]
-    html_bytes, _ = _fetch_bytes(url)
-    if not html_bytes:
-        return ""
-    html = html_bytes.decode("utf-8", "ignore")
-    marker = '"channelId":"'
-    idx = html.find(marker)
-    if idx != -1:
-        start = idx + len(marker)
-        end = html.find('"', start)
-        if end != -1:
-            return html[start:end]
-    import re
-
-    m = re.search(r"(UC[a-zA-Z0-9_-]{20,})", html)
-    if m:
-        return m.group(1)
+    # The id normally shows up in the page head; only fetch the whole page if it doesn't
+    for max_bytes in (65536, None):
+        html_bytes, _ = _fetch_bytes(url, max_bytes=max_bytes)
+        if not html_bytes:
+            return ""
+        marker = b'"channelId":"'
+        idx = html_bytes.find(marker)
+        if idx != -1:
+            start = idx + len(marker)
+            end = html_bytes.find(b'"', start)
+            if end != -1:
+                return html_bytes[start:end].decode("ascii", "ignore")
+        m = _YT_CHANNEL_RE.search(html_bytes)
+        if m:
+            return m.group(0).decode("ascii")
+        if max_bytes is not None and len(html_bytes) < max_bytes:
+            break
     return ""
 
 
+def _resolve_youtube_channel_ids(channels: List[Dict[str, str]], executor: ThreadPoolExecutor) -> List[str]:
+    """Return a channel id per channel, scraping only those not configured or cached."""
+    cache_path = os.path.join(_CACHE_DIR, "yt_channels.json")
+    try:
+        with open(cache_path, "rb") as f:
+            known = _json_loads(f.read())
+    except (OSError, ValueError):
+        known = {}
+    if not isinstance(known, dict):
+        known = {}
+
+    def resolve(channel: Dict[str, str]) -> str:
+        return channel.get("channel_id") or known.get(channel["url"]) or _extract_youtube_channel_id(channel["url"])
+
+    channel_ids = list(executor.map(resolve, channels))
+    resolved = {
+        channel["url"]: channel_id
+        for channel, channel_id in zip(channels, channel_ids)
+        if channel_id and not channel.get("channel_id") and known.get(channel["url"]) != channel_id
+    }
+    if resolved:
+        known.update(resolved)
+        try:
+            _write_cache_file(cache_path, known)
+        except OSError as e:
+            print(f"warning: could not cache YouTube channel ids: {e}", file=sys.stderr)
+    return channel_ids
+
+
 def _format_link_pair(message: str, link: str, link_label: str, include_share: bool = True) -> str:
     if not link:
         return message
     if include_share:
-        share = f"https://bsky.app/intent/compose?text={quote_plus(message + ' ' + link)}"
+        share = _SHARE_PREFIX + quote(f"{message} {link}", safe="")
         return f"{message} [{link_label}]({link}) [Bsky]({share})"
     return f"{message} [{link_label}]({link})"
 
 
 def _load_youtube_channels(path: str) -> List[Dict[str, str]]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = _json_loads(f.read())
     if isinstance(data, dict):
         data = [data]
     if not isinstance(data, list):
@@ -377,15 +598,18 @@ def _load_youtube_channels(path: str) -> List[Dict[str, str]]:
         if isinstance(item, str):
             url = item.strip()
             name = ""
+            channel_id = ""
         elif isinstance(item, dict):
             url = str(item.get("url", "")).strip()
             name = str(item.get("name", "")).strip()
+            channel_id = str(item.get("channel_id", "")).strip()
         else:
             url = ""
             name = ""
+            channel_id = ""
         if not url:
             raise ValueError(f"YouTube item {idx} is missing a url.")
-        channels.append({"url": url, "name": name})
+        channels.append({"url": url, "name": name, "channel_id": channel_id})
     return channels
 
 
@@ -401,28 +625,60 @@ def generate_markdown(
 
     def record_failure(category: str, name: str, url: str, detail: str):
         failures.append({"category": category, "name": name, "url": url, "detail": detail})
+
+    def fetch(url: str) -> Tuple[Optional[bytes], Optional[str]]:
+        if not url:
+            return None, None
+        try:
+            return _fetch_bytes(url)
+        except Exception as e:
+            return None, str(e)
+
+    # Entries older than this are skipped while parsing newest-first feeds
+    since = _yesterday_range_utc()["start"]
+
+    # Fetch every feed up front; rendering below walks the results in input order
+    max_workers = int(os.environ.get("NEWS_FETCH_WORKERS", "16"))
+    fetched: Dict[str, List[Tuple[Dict[str, str], str, Optional[bytes], Optional[str]]]] = {
+        "blog": [],
+        "youtube": [],
+        "bluesky": [],
+        "github": [],
+    }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # YouTube feed URLs need the channel id, which may require an HTML fetch first
+        channel_ids = _resolve_youtube_channel_ids(youtube_channels, executor)
+        jobs: List[Tuple[str, Dict[str, str], str]] = []
+        jobs.extend(("blog", feed, feed["url"]) for feed in blog_feeds)
+        for channel, channel_id in zip(youtube_channels, channel_ids):
+            feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}" if channel_id else ""
+            jobs.append(("youtube", channel, feed_url))
+        jobs.extend(("bluesky", source, source["url"]) for source in sources)
+        jobs.extend(("github", {"repo": repo}, f"https://github.com/{repo}/releases.atom") for repo in github_repos)
+        results = executor.map(fetch, [url for _, _, url in jobs])
+        for (section, meta, url), (xml_bytes, err) in zip(jobs, results):
+            fetched[section].append((meta, url, xml_bytes, err))
+
     # Blogs
     blog_section: List[str] = []
-    if blog_feeds:
-        for feed in blog_feeds:
-            xml_bytes, err = _fetch_bytes(feed["url"])
-            if not xml_bytes:
-                record_failure("blog", feed.get("name") or feed["url"], feed["url"], err or "fetch failed")
-                continue
-            feed_title, entries = _safe_parse_feed_with_title(xml_bytes, feed["url"])
-            if not entries and feed_title is None:
-                record_failure("blog", feed.get("name") or feed["url"], feed["url"], "parse failed")
-            entries = _filter_previous_day(entries)
-            if not entries:
-                continue
-            name = feed["name"] or feed_title or feed["url"]
-            blog_section.append(f"### {name}")
-            blog_section.append("")
-            for entry in entries:
-                message = entry.get("title") or entry.get("message") or "Untitled"
-                link = entry.get("link") or ""
-                blog_section.append(f"- {_format_link_pair(message, link, 'Article')}")
-            blog_section.append("")
+    for feed, url, xml_bytes, err in fetched["blog"]:
+        if not xml_bytes:
+            record_failure("blog", feed.get("name") or url, url, err or "fetch failed")
+            continue
+        feed_title, entries = _safe_parse_feed_with_title(xml_bytes, url, since)
+        if not entries and feed_title is None:
+            record_failure("blog", feed.get("name") or url, url, "parse failed")
+        entries = _filter_previous_day(entries)
+        if not entries:
+            continue
+        name = feed["name"] or feed_title or url
+        blog_section.append(f"### {name}")
+        blog_section.append("")
+        for entry in entries:
+            message = entry.get("title") or entry.get("message") or "Untitled"
+            link = entry.get("link") or ""
+            blog_section.append(f"- {_format_link_pair(message, link, 'Article')}")
+        blog_section.append("")
     if blog_section:
         lines.append("## Blogs")
         lines.append("")
@@ -430,32 +686,28 @@ def generate_markdown(
 
     # YouTube
     youtube_section: List[str] = []
-    if youtube_channels:
-        for channel in youtube_channels:
-            channel_id = _extract_youtube_channel_id(channel["url"])
-            if not channel_id:
-                print(f"warning: skipping YouTube channel {channel['url']} (could not resolve id)", file=sys.stderr)
-                record_failure("youtube", channel.get("name") or channel["url"], channel["url"], "could not resolve channel id")
-                continue
-            feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-            xml_bytes, err = _fetch_bytes(feed_url)
-            if not xml_bytes:
-                record_failure("youtube", channel.get("name") or channel["url"], feed_url, err or "fetch failed")
-                continue
-            feed_title, entries = _safe_parse_feed_with_title(xml_bytes, feed_url)
-            if not entries and feed_title is None:
-                record_failure("youtube", channel.get("name") or channel["url"], feed_url, "parse failed")
-            entries = _filter_previous_day(entries)
-            if not entries:
-                continue
-            name = channel["name"] or feed_title or channel["url"]
-            youtube_section.append(f"### {name}")
-            youtube_section.append("")
-            for entry in entries:
-                message = entry.get("title") or entry.get("message") or "Untitled"
-                link = entry.get("link") or ""
-                youtube_section.append(f"- {_format_link_pair(message, link, 'Video')}")
-            youtube_section.append("")
+    for channel, feed_url, xml_bytes, err in fetched["youtube"]:
+        if not feed_url:
+            print(f"warning: skipping YouTube channel {channel['url']} (could not resolve id)", file=sys.stderr)
+            record_failure("youtube", channel.get("name") or channel["url"], channel["url"], "could not resolve channel id")
+            continue
+        if not xml_bytes:
+            record_failure("youtube", channel.get("name") or channel["url"], feed_url, err or "fetch failed")
+            continue
+        feed_title, entries = _safe_parse_feed_with_title(xml_bytes, feed_url, since)
+        if not entries and feed_title is None:
+            record_failure("youtube", channel.get("name") or channel["url"], feed_url, "parse failed")
+        entries = _filter_previous_day(entries)
+        if not entries:
+            continue
+        name = channel["name"] or feed_title or channel["url"]
+        youtube_section.append(f"### {name}")
+        youtube_section.append("")
+        for entry in entries:
+            message = entry.get("title") or entry.get("message") or "Untitled"
+            link = entry.get("link") or ""
+            youtube_section.append(f"- {_format_link_pair(message, link, 'Video')}")
+        youtube_section.append("")
     if youtube_section:
         lines.append("## YouTube")
         lines.append("")
@@ -463,21 +715,19 @@ def generate_markdown(
 
     # BlueSky
     bluesky_section: List[str] = []
-    for source in sources:
+    for source, url, xml_bytes, err in fetched["bluesky"]:
         name = source["name"]
-        url = source["url"]
-        xml_bytes, err = _fetch_bytes(url)
         if not xml_bytes:
             record_failure("bluesky", name, url, err or "fetch failed")
             continue
-        _, entries = _safe_parse_feed_with_title(xml_bytes, url)
+        _, entries = _safe_parse_feed_with_title(xml_bytes, url, since)
         if not entries:
             record_failure("bluesky", name, url, "parse failed")
             continue
-        entries.sort(key=lambda e: e.get("date") or datetime.min, reverse=True)
         entries = _filter_previous_day(entries)
         if not entries:
             continue
+        entries.sort(key=lambda e: e.get("date") or _DT_MIN, reverse=True)
         bluesky_section.append(f"### {name}")
         bluesky_section.append("")
         for entry in entries:
@@ -492,31 +742,29 @@ def generate_markdown(
 
     # GitHub Releases
     github_section: List[str] = []
-    if github_repos:
-        for repo in github_repos:
-            feed_url = f"https://github.com/{repo}/releases.atom"
-            xml_bytes, err = _fetch_bytes(feed_url)
-            if not xml_bytes:
-                record_failure("github", repo, feed_url, err or "fetch failed")
-                continue
-            _, entries = _safe_parse_feed_with_title(xml_bytes, feed_url)
-            if not entries:
-                record_failure("github", repo, feed_url, "parse failed")
-                continue
-            entries = _filter_previous_day(entries)
-            if not entries:
-                continue
-            latest = _latest_entry(entries)
-            if not latest:
-                continue
-            title = latest.get("title") or "Untitled"
-            details = latest.get("message")
-            link = latest.get("link") or f"https://github.com/{repo}/releases"
-            if details and details != title:
-                full_msg = f"{repo}: {title} — {details}"
-            else:
-                full_msg = f"{repo}: {title}"
-            github_section.append(f"- {_format_link_pair(full_msg, link, 'Release')}")
+    for meta, feed_url, xml_bytes, err in fetched["github"]:
+        repo = meta["repo"]
+        if not xml_bytes:
+            record_failure("github", repo, feed_url, err or "fetch failed")
+            continue
+        _, entries = _safe_parse_feed_with_title(xml_bytes, feed_url, since)
+        if not entries:
+            record_failure("github", repo, feed_url, "parse failed")
+            continue
+        entries = _filter_previous_day(entries)
+        if not entries:
+            continue
+        latest = _latest_entry(entries)
+        if not latest:
+            continue
+        title = latest.get("title") or "Untitled"
+        details = latest.get("message")
+        link = latest.get("link") or f"https://github.com/{repo}/releases"
+        if details and details != title:
+            full_msg = f"{repo}: {title} — {details}"
+        else:
+            full_msg = f"{repo}: {title}"
+        github_section.append(f"- {_format_link_pair(full_msg, link, 'Release')}")
     if github_section:
         lines.append("## GitHub Releases")
         lines.append("")
@@ -570,7 +818,7 @@ def main() -> int:
 
     report_date = (datetime.now(tz=timezone.utc).date() - timedelta(days=1)).isoformat()
     output_path = args.output or f"{report_date}.md"
-    sources = _fetch_list_members(args.list)
+    sources = _load_list_members(args.list)
     github_repos = _load_github_repos(args.github_input) if args.github_input else []
     blog_feeds = _load_blog_feeds(args.blogs_input) if args.blogs_input else []
     youtube_channels = _load_youtube_channels(args.youtube_input) if args.youtube_input else []
@@ -1,177 +1,578 @@
 #!/usr/bin/env python3
 import argparse
+import functools
+import gzip
+import hashlib
 import json
 import os
+import random
+import re
+import sqlite3
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Tuple
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Protocol, Tuple
+
+import urllib3
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # stdlib json accepts bytes too, just slower
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 # Maximum input length to send to the API (to prevent timeouts with extremely long texts)
 MAX_INPUT_LENGTH = int(os.environ.get("SUMMARY_MAX_INPUT", "10000"))
+# Token cap applied instead of the character cap when tiktoken is installed (0 disables)
+MAX_INPUT_TOKENS = int(os.environ.get("SUMMARY_MAX_INPUT_TOKENS", "3000"))
 # Maximum number of retries for API calls
 MAX_RETRIES = int(os.environ.get("SUMMARY_MAX_RETRIES", "3"))
 # Initial retry delay in seconds
 RETRY_DELAY = int(os.environ.get("SUMMARY_RETRY_DELAY", "2"))
-# Minimum delay between calls to reduce rate-limit errors
-MIN_CALL_INTERVAL = float(os.environ.get("SUMMARY_MIN_INTERVAL", "1.0"))
+# Upper bound for a single retry delay in seconds
+MAX_DELAY = int(os.environ.get("SUMMARY_MAX_DELAY", "60"))
+# Client-side rate limit: sustained requests per second (0 disables) and burst size
+REQUESTS_PER_SECOND = float(os.environ.get("SUMMARY_RPS", "1.0"))
+BURST = int(os.environ.get("SUMMARY_BURST", "5"))
 # API call timeout in seconds
 API_TIMEOUT = int(os.environ.get("SUMMARY_TIMEOUT", "60"))
+# Lines at most this factor over the limit are trimmed locally instead of summarized
+LOCAL_TRIM_RATIO = float(os.environ.get("SUMMARY_LOCAL_TRIM_RATIO", "1.15"))
 # Maximum number of summaries per run to avoid runaway jobs
 MAX_SUMMARIES = int(os.environ.get("SUMMARY_MAX_CALLS", "50"))
+# Long lines sent together in one batched request
+BATCH_SIZE = max(1, int(os.environ.get("SUMMARY_BATCH_SIZE", "5")))
+# Number of API calls allowed in flight at once; lower it if the endpoint throttles
+CONCURRENCY = max(1, int(os.environ.get("SUMMARY_CONCURRENCY", "8")))
+# SQLite file caching summaries between runs; empty disables the cache
+CACHE_PATH = os.environ.get("SUMMARY_CACHE", "cache/summaries.sqlite")
+# Gzip request bodies (and ask for gzipped responses); off unless SUMMARY_GZIP=1
+GZIP_BODIES = os.environ.get("SUMMARY_GZIP", "0") == "1"
+# API client: "urllib" (pooled urllib3 requests) or "azure" (azure-ai-inference SDK)
+BACKEND_NAME = os.environ.get("SUMMARY_BACKEND", "urllib")
 # Explicit User-Agent to keep GitHub Models happy
 USER_AGENT = os.environ.get("SUMMARY_USER_AGENT", "news-summarizer/1.0")
 
+# Shared connection pool so consecutive API calls reuse the same TLS connection;
+# one kept-alive connection per concurrent worker
+_POOL = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=CONCURRENCY,
+    retries=urllib3.Retry(total=2, backoff_factor=0.3),
+)
+
+SYSTEM_PROMPT = (
+    "Summarize the text to fit within the requested character limit. "
+    "Preserve key details, names, and links mentioned in the text. "
+    "Return a single line of plain text without Markdown formatting or bullet markers. "
+    "Do not add newlines or headings. Keep URLs untouched."
+)
+BATCH_SYSTEM_PROMPT = (
+    'You receive a JSON object like {"limit": N, "texts": [...]}. '
+    "Summarize each text to fit within N characters. "
+    "Preserve key details, names, and links mentioned in the text. "
+    "Each summary must be a single line of plain text without Markdown formatting or bullet markers. "
+    "Keep URLs untouched. "
+    "Return only a JSON array of strings, one summary per input text, in the same order."
+)
+
+_WS_RE = re.compile(r"\s+")
+_BULLET_RE = re.compile(r"^- .*$", re.MULTILINE)
+# " [Label](url)" groups closing an entry's text, e.g. the [Release] link before the share link
+_TRAILING_LINKS_RE = re.compile(r"(?: \[[^\]]*\]\([^)\s]*\))+$")
+
+_cache_conn: Optional[sqlite3.Connection] = None
+_cache_lock = threading.Lock()
+_warmed = False
+_warm_lock = threading.Lock()
+
+
+class _TokenBucket:
+    """Token-bucket limiter shared by all worker threads; throttles before sending."""
+
+    def __init__(self, capacity: int, refill_rate: float) -> None:
+        self.capacity = max(1, capacity)
+        self.refill_rate = refill_rate
+        self.tokens = float(self.capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.refill_rate <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_rate)
+            self.last = now
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.refill_rate
+                time.sleep(wait)
+                self.tokens = 1.0
+                self.last = now + wait
+            self.tokens -= 1
+
+
+_BUCKET = _TokenBucket(capacity=BURST, refill_rate=REQUESTS_PER_SECOND)
+
 
 def _wrap_summary(text: str) -> str:
     """Return a Markdown-safe, quoted summary string."""
     if not text:
         return text
-    clean = " ".join(text.split())  # collapse whitespace/newlines
-    clean = clean.replace('"', "'").strip()
+    clean = _WS_RE.sub(" ", text).strip().replace('"', "'")  # collapse whitespace/newlines
     return f"\"{clean}\""
 
 
 def _split_link(line: str) -> Tuple[str, str]:
-    idx = line.rfind("](")
-    if idx == -1:
+    head, sep, _ = line.rpartition("](")
+    if not sep:
         return line, ""
-    start = line.rfind(" [", 0, idx)
+    start = head.rfind(" [")
     if start == -1:
         return line, ""
     return line[:start], line[start:]
 
 
-def _call_api(prompt: str, max_chars: int, token: str, endpoint: str, model: str) -> str:
-    payload = {
-        "model": model,
-        "messages": [
-            {
-                "role": "system",
-                "content": (
-                "Summarize the text to fit within the requested character limit. "
-                    "Preserve key details, names, and links mentioned in the text. "
-                    "Return a single line of plain text without Markdown formatting or bullet markers. "
-                    "Do not add newlines or headings. Keep URLs untouched."
-                ),
-            },
-            {"role": "user", "content": f"Limit: {max_chars} characters.\nText: {prompt}"},
-        ],
+class APIError(RuntimeError):
+    """Error response from the models endpoint."""
+
+    def __init__(self, message: str, status: int, retry_after: Optional[float] = None, detail: str = "") -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        self.detail = detail
+
+
+def _model_name() -> str:
+    return os.environ.get("GITHUB_MODELS_MODEL", "openai/gpt-4.1")
+
+
+def _cache_key(prompt: str, max_chars: int) -> str:
+    return hashlib.sha256(f"{_model_name()}|{max_chars}|{prompt}".encode("utf-8")).hexdigest()
+
+
+def _open_cache() -> Optional[sqlite3.Connection]:
+    global _cache_conn
+    if _cache_conn is None and CACHE_PATH:
+        try:
+            os.makedirs(os.path.dirname(CACHE_PATH) or ".", exist_ok=True)
+            conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS s(key TEXT PRIMARY KEY, value TEXT)")
+            _cache_conn = conn
+        except (OSError, sqlite3.Error) as e:
+            print(f"[summarize] Warning: summary cache disabled: {e}", flush=True)
+    return _cache_conn
+
+
+def _cache_get(prompt: str, max_chars: int) -> Optional[str]:
+    with _cache_lock:
+        conn = _open_cache()
+        if conn is None:
+            return None
+        row = conn.execute("SELECT value FROM s WHERE key = ?", (_cache_key(prompt, max_chars),)).fetchone()
+    return row[0] if row else None
+
+
+def _cache_put(prompt: str, max_chars: int, summary: str) -> None:
+    with _cache_lock:
+        conn = _open_cache()
+        if conn is not None:
+            conn.execute(
+                "INSERT OR REPLACE INTO s(key, value) VALUES (?, ?)",
+                (_cache_key(prompt, max_chars), summary),
+            )
+
+
+def _close_cache() -> None:
+    global _cache_conn
+    with _cache_lock:
+        if _cache_conn is not None:
+            # Single commit per run instead of an fsync per summary
+            _cache_conn.commit()
+            _cache_conn.close()
+            _cache_conn = None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the Retry-After delay in seconds, from either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+def _call_api(messages: List[Dict[str, str]], token: str, endpoint: str, model: str) -> str:
+    payload = {"model": model, "messages": messages}
+    body = _json_dumps(payload)
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "User-Agent": USER_AGENT,
+        "X-GitHub-Api-Version": "2023-07-07",
     }
-    body = json.dumps(payload).encode("utf-8")
-    req = Request(
-        endpoint,
-        data=body,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": USER_AGENT,
-            "X-GitHub-Api-Version": "2023-07-07",
-        },
-        method="POST",
-    )
+    if GZIP_BODIES:
+        # urllib3 decodes gzipped responses on its own
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Accept-Encoding"] = "gzip"
     try:
-        with urlopen(req, timeout=API_TIMEOUT) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-        content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-        return content.strip()
-    except HTTPError as e:
-        detail = ""
-        try:
-            detail = e.read().decode("utf-8", "ignore")
-        except Exception:
-            detail = ""
-        msg = f"{e.code} {e.reason}".strip()
+        resp = _POOL.request(
+            "POST",
+            endpoint,
+            body=body,
+            headers=headers,
+            timeout=urllib3.Timeout(connect=min(5, API_TIMEOUT), read=API_TIMEOUT),
+        )
+    except urllib3.exceptions.MaxRetryError as e:
+        if isinstance(e.reason, urllib3.exceptions.TimeoutError):
+            raise TimeoutError(f"API call timed out after {API_TIMEOUT} seconds") from e
+        raise
+    except urllib3.exceptions.TimeoutError as e:
+        raise TimeoutError(f"API call timed out after {API_TIMEOUT} seconds") from e
+    if resp.status >= 400:
+        detail = resp.data.decode("utf-8", "ignore")
+        msg = f"{resp.status} {resp.reason or ''}".strip()
         if detail:
             msg = f"{msg}: {detail}"
-        raise RuntimeError(msg) from e
+        raise APIError(msg, resp.status, _parse_retry_after(resp.headers.get("Retry-After")), detail)
+    data = _json_loads(resp.data)
+    content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+    return content.strip()
+
+
+class _Backend(Protocol):
+    def warm(self, token: str, endpoint: str) -> None: ...
+
+    def complete(self, messages: List[Dict[str, str]], token: str, endpoint: str, model: str) -> str: ...
+
+
+class _UrllibBackend:
+    def warm(self, token: str, endpoint: str) -> None:
+        # Any response will do: it leaves a resolved, TLS-established connection in the pool
+        _POOL.request(
+            "HEAD",
+            endpoint,
+            headers={"User-Agent": USER_AGENT},
+            timeout=urllib3.Timeout(total=5),
+            retries=False,
+        )
+
+    def complete(self, messages: List[Dict[str, str]], token: str, endpoint: str, model: str) -> str:
+        return _call_api(messages, token, endpoint, model)
+
 
+class _AzureBackend:
+    """Chat completions through azure-ai-inference; errors are mapped onto the urllib backend's."""
 
-def _call_with_timeout(prompt: str, max_chars: int, token: str, endpoint: str, model: str) -> str:
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(_call_api, prompt, max_chars, token, endpoint, model)
+    def __init__(self) -> None:
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self, endpoint: str, token: str):
+        # One client for the whole run so its HTTP session and connections are reused
+        with self._lock:
+            if self._client is None:
+                from azure.ai.inference import ChatCompletionsClient
+                from azure.core.credentials import AzureKeyCredential
+
+                # The SDK appends /chat/completions itself
+                base = endpoint.rstrip("/").removesuffix("/chat/completions").removesuffix("/v1")
+                # Retries and 429 backoff stay with _request_completion
+                self._client = ChatCompletionsClient(
+                    endpoint=base, credential=AzureKeyCredential(token), user_agent=USER_AGENT, retry_total=0
+                )
+            return self._client
+
+    def warm(self, token: str, endpoint: str) -> None:
+        # Creating the client is enough; a probe completion would cost a real request
+        self._get_client(endpoint, token)
+
+    def complete(self, messages: List[Dict[str, str]], token: str, endpoint: str, model: str) -> str:
+        from azure.core.exceptions import HttpResponseError, ServiceRequestTimeoutError, ServiceResponseTimeoutError
+
+        client = self._get_client(endpoint, token)
         try:
-            return future.result(timeout=API_TIMEOUT)
-        except FuturesTimeoutError as exc:
-            future.cancel()
-            raise TimeoutError(f"API call timed out after {API_TIMEOUT} seconds") from exc
+            response = client.complete(
+                messages=messages,
+                model=model,
+                connection_timeout=min(5, API_TIMEOUT),
+                read_timeout=API_TIMEOUT,
+            )
+        except (ServiceRequestTimeoutError, ServiceResponseTimeoutError) as e:
+            raise TimeoutError(f"API call timed out after {API_TIMEOUT} seconds") from e
+        except HttpResponseError as e:
+            status = e.status_code or 0
+            retry_after = _parse_retry_after(e.response.headers.get("Retry-After")) if e.response is not None else None
+            raise APIError(str(e), status, retry_after) from e
+        return (response.choices[0].message.content or "").strip()
 
 
-def _call_github_models(prompt: str, max_chars: int) -> str:
+_BACKENDS = {"urllib": _UrllibBackend, "azure": _AzureBackend}
+if BACKEND_NAME not in _BACKENDS:
+    print(f"[summarize] Unknown SUMMARY_BACKEND {BACKEND_NAME!r}, using urllib", flush=True)
+_BACKEND: _Backend = _BACKENDS.get(BACKEND_NAME, _UrllibBackend)()
+
+
+def _next_delay(previous: float) -> float:
+    """Decorrelated jitter: spread retries out instead of doubling in lockstep."""
+    return min(MAX_DELAY, random.uniform(RETRY_DELAY, previous * 3))
+
+
+def _api_settings() -> Tuple[str, str]:
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GITHUB_MODELS_TOKEN")
     if not token:
         raise RuntimeError("Missing GITHUB_TOKEN or GITHUB_MODELS_TOKEN.")
-    model = os.environ.get("GITHUB_MODELS_MODEL", "openai/gpt-4.1")
     endpoint = os.environ.get(
         "GITHUB_MODELS_ENDPOINT",
         "https://models.github.ai/inference/v1/chat/completions",
     )
+    return token, endpoint
 
-    if len(prompt) > MAX_INPUT_LENGTH:
-        prompt = prompt[:MAX_INPUT_LENGTH] + "..."
-        print(f"[summarize] Warning: Input truncated to {MAX_INPUT_LENGTH} characters", flush=True)
 
-    # Simple pacing to avoid hammering the endpoint
-    if MIN_CALL_INTERVAL > 0:
-        now = time.monotonic()
-        last = _call_github_models._last_call  # type: ignore[attr-defined]
-        elapsed = now - last if last else None
-        if elapsed is not None and elapsed < MIN_CALL_INTERVAL:
-            sleep_for = MIN_CALL_INTERVAL - elapsed
-            time.sleep(sleep_for)
-    _call_github_models._last_call = time.monotonic()  # type: ignore[attr-defined]
+def _warm_up() -> None:
+    """Resolve DNS and open the TLS connection before the first real request; failures are ignored."""
+    global _warmed
+    with _warm_lock:
+        if _warmed:
+            return
+        _warmed = True
+        try:
+            _BACKEND.warm(*_api_settings())
+        except Exception as e:
+            print(f"[summarize] Connection warm-up failed: {e}", flush=True)
+
 
+def _request_completion(messages: List[Dict[str, str]]) -> str:
+    # Only runs on a cache miss, so reruns served from the cache skip the warm-up request
+    _warm_up()
+    token, endpoint = _api_settings()
+    model = _model_name()
+
+    delay = RETRY_DELAY
     for attempt in range(MAX_RETRIES):
+        _BUCKET.acquire()
         try:
-            content = _call_with_timeout(prompt, max_chars, token, endpoint, model)
-            if len(content) > max_chars:
-                content = content[: max_chars - 1].rstrip() + "…"
-            return content
+            return _BACKEND.complete(messages, token, endpoint, model)
+        except TimeoutError as e:
+            if attempt >= MAX_RETRIES - 1:
+                print(f"[summarize] API call timed out after {MAX_RETRIES} attempts: {e}", flush=True)
+                raise
+            delay = _next_delay(delay)
+            print(f"[summarize] API call timed out (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Retrying in {delay:.1f}s...", flush=True)
+            time.sleep(delay)
         except Exception as e:
             is_last = attempt >= MAX_RETRIES - 1
-            # crude check for rate limit; backoff and retry
-            if not is_last and ("429" in str(e) or "rate" in str(e).lower()):
-                retry_after = getattr(e, "headers", None)
-                delay = None
-                if retry_after:
-                    try:
-                        delay = int(retry_after.get("Retry-After", "0"))
-                    except Exception:
-                        delay = None
-                if delay is None or delay <= 0:
-                    delay = RETRY_DELAY * (2 ** attempt)
-                print(f"[summarize] Rate limited (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Backing off {delay}s...", flush=True)
+            if not is_last and isinstance(e, APIError) and e.status == 429:
+                delay = _next_delay(delay)
+                if e.retry_after:
+                    # Honor the server's hint, jittered so concurrent workers do not retry in lockstep
+                    delay = e.retry_after + random.uniform(0, e.retry_after * 0.25)
+                print(f"[summarize] Rate limited (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Backing off {delay:.1f}s...", flush=True)
                 time.sleep(delay)
                 continue
             if not is_last:
-                delay = RETRY_DELAY * (2 ** attempt)
-                print(f"[summarize] API call failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Retrying in {delay}s...", flush=True)
+                delay = _next_delay(delay)
+                print(f"[summarize] API call failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Retrying in {delay:.1f}s...", flush=True)
                 time.sleep(delay)
             else:
                 print(f"[summarize] API call failed after {MAX_RETRIES} attempts: {e}", flush=True)
                 raise
+    return ""
 
 
-def _summarize_line(line: str, max_chars: int) -> str:
-    if not line.startswith("- "):
-        return line
-    message, link_part = _split_link(line)
-    text = message[2:].strip()
-    if len(text) <= max_chars:
-        return line
+@functools.lru_cache(maxsize=None)
+def _encoding():
+    """Load the tiktoken encoding on first use; None keeps the character cap."""
+    if MAX_INPUT_TOKENS <= 0:
+        return None
+    # Keep the BPE file with the other caches the workflow persists instead of downloading it every run
+    os.environ.setdefault("TIKTOKEN_CACHE_DIR", os.path.join("cache", "tiktoken"))
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model("gpt-4o")
+    except Exception:  # missing package or BPE download failure
+        return None
+
+
+def _truncate_input(prompt: str) -> str:
+    encoding = _encoding()
+    if encoding is not None:
+        # Special-token strings like <|endoftext|> are plain text in feed entries
+        tokens = encoding.encode(prompt, disallowed_special=())
+        if len(tokens) > MAX_INPUT_TOKENS:
+            print(f"[summarize] Warning: Input truncated to {MAX_INPUT_TOKENS} tokens", flush=True)
+            return encoding.decode(tokens[:MAX_INPUT_TOKENS]) + "..."
+        return prompt
+    if len(prompt) > MAX_INPUT_LENGTH:
+        print(f"[summarize] Warning: Input truncated to {MAX_INPUT_LENGTH} characters", flush=True)
+        return prompt[:MAX_INPUT_LENGTH] + "..."
+    return prompt
+
+
+def _fit_summary(content: str, max_chars: int) -> str:
+    if len(content) > max_chars:
+        content = content[: max_chars - 1].rstrip() + "…"
+    return content
+
+
+def _soft_trim(text: str, max_chars: int) -> str:
+    """Cut at the last space that leaves room for the ellipsis."""
+    cut = text.rfind(" ", 0, max_chars)
+    if cut <= 0:
+        cut = max_chars - 1
+    return text[:cut].rstrip() + "…"
+
+
+def _split_trailing_links(text: str) -> Tuple[str, str]:
+    """Split trailing Markdown links off the text so only the prose is measured and trimmed."""
+    match = _TRAILING_LINKS_RE.search(text)
+    if not match:
+        return text, ""
+    return text[: match.start()], match.group()
+
+
+def _local_trim(text: str, max_chars: int) -> Optional[str]:
+    """Return the quoted, shortened entry when a summary would add nothing; None means summarize.
+
+    Trailing links are kept intact after the trimmed prose:
+
+    >>> _local_trim("repo: fix the thing now [Release](https://github.com/o/r/releases/tag/v1)", 20)
+    '"repo: fix the thing…" [Release](https://github.com/o/r/releases/tag/v1)'
+    """
+    prose, links = _split_trailing_links(text)
+    if "](" in prose or len(prose) <= max_chars:
+        # A link we could not split off, or only the links are over the limit: leave it to the model
+        return None
+    if len(prose) <= max_chars * LOCAL_TRIM_RATIO:
+        return f"{_wrap_summary(_soft_trim(prose, max_chars))}{links}"
+    if " " not in prose[max(0, max_chars - 50) : max_chars + 50]:
+        # One unbroken token (URL, code, hash) around the limit: the model can only hard-cut it too
+        return f"{_wrap_summary(prose[: max_chars - 1] + '…')}{links}"
+    return None
+
+
+def _call_github_models(prompt: str, max_chars: int) -> str:
+    cached = _cache_get(prompt, max_chars)
+    if cached:
+        return cached
+    content = _request_completion(
+        [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": f"Limit: {max_chars} characters.\nText: {_truncate_input(prompt)}"},
+        ]
+    )
+    summary = _fit_summary(content, max_chars)
+    if summary:
+        _cache_put(prompt, max_chars, summary)
+    return summary
+
+
+def _batch_groups(pending: List[Tuple[int, str]]) -> List[List[Tuple[int, str]]]:
+    """Split pending lines into groups of BATCH_SIZE whose combined text stays within MAX_INPUT_LENGTH."""
+    groups: List[List[Tuple[int, str]]] = []
+    group: List[Tuple[int, str]] = []
+    size = 0
+    for idx, text in pending:
+        length = min(len(text), MAX_INPUT_LENGTH)
+        if group and (len(group) >= BATCH_SIZE or size + length > MAX_INPUT_LENGTH):
+            groups.append(group)
+            group, size = [], 0
+        group.append((idx, text))
+        size += length
+    if group:
+        groups.append(group)
+    return groups
+
+
+def _call_github_models_batch(pending: List[Tuple[int, str]], max_chars: int) -> Dict[int, str]:
+    """Summarize several texts in one request; returns summaries keyed by id."""
+    summaries: Dict[int, str] = {}
+    misses: List[Tuple[int, str]] = []
+    for idx, text in pending:
+        cached = _cache_get(text, max_chars)
+        if cached:
+            summaries[idx] = cached
+        else:
+            misses.append((idx, text))
+    if not misses:
+        return summaries
+    prompts = [_truncate_input(text) for _, text in misses]
+    content = _request_completion(
+        [
+            {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": json.dumps({"limit": max_chars, "texts": prompts}, ensure_ascii=False)},
+        ]
+    )
+    if content.startswith("```"):
+        # Models sometimes wrap JSON in a fenced code block
+        content = content.strip("`").strip()
+        if content.startswith("json"):
+            content = content[4:]
+    data = json.loads(content)
+    if not isinstance(data, list) or len(data) != len(misses):
+        raise ValueError(f"batch response does not hold {len(misses)} summaries")
+    for (idx, text), summary in zip(misses, data):
+        if not isinstance(summary, str) or not summary.strip():
+            continue
+        summaries[idx] = _fit_summary(summary.strip(), max_chars)
+        _cache_put(text, max_chars, summaries[idx])
+    return summaries
+
+
+def _summarize_precomputed(text: str, link_part: str, max_chars: int) -> str:
+    """Summarize an already-split long entry; returns "" when the original line should be kept."""
     try:
         summary = _call_github_models(text, max_chars)
         if not summary:
             print("[summarize] Empty summary returned, keeping original line", flush=True)
-            return line
+            return ""
         wrapped = _wrap_summary(summary)
         return f"- {wrapped}{link_part}"
     except Exception as e:
         print(f"[summarize] Error summarizing line: {e}. Keeping original line.", flush=True)
+        return ""
+
+
+def _summarize_line(line: str, max_chars: int) -> str:
+    if not line.startswith("- "):
         return line
+    message, link_part = _split_link(line)
+    text = message[2:].strip()
+    if len(text) <= max_chars:
+        return line
+    trimmed = _local_trim(text, max_chars)
+    if trimmed is not None:
+        return f"- {trimmed}{link_part}"
+    return _summarize_precomputed(text, link_part, max_chars) or line
+
+
+def _run_all(executor: Optional[ThreadPoolExecutor], fn, calls: List[tuple]) -> list:
+    """Run fn over each argument tuple, inline without an executor; exceptions are returned, not raised."""
+    if executor is None:
+        results = []
+        for call in calls:
+            try:
+                results.append(fn(*call))
+            except Exception as e:
+                results.append(e)
+        return results
+    futures = [executor.submit(fn, *call) for call in calls]
+    return [future.exception() or future.result() for future in futures]
 
 
 def main() -> int:
@@ -185,40 +586,100 @@ def main() -> int:
 
     print(
         f"[summarize] Config: file={path}, max_chars={args.max_chars}, "
-        f"timeout={API_TIMEOUT}s, max_calls={MAX_SUMMARIES}, max_input={MAX_INPUT_LENGTH}, retries={MAX_RETRIES}, min_interval={MIN_CALL_INTERVAL}s",
+        f"backend={BACKEND_NAME}, timeout={API_TIMEOUT}s, max_calls={MAX_SUMMARIES}, max_input={MAX_INPUT_LENGTH}, retries={MAX_RETRIES}, rps={REQUESTS_PER_SECOND}, burst={BURST}, "
+        f"concurrency={CONCURRENCY}",
         flush=True,
     )
+    # One regex scan over the whole file finds the bullet lines; keys are their offsets in the buffer
     with open(path, "r", encoding="utf-8") as f:
-        lines = f.read().splitlines()
-
-    print(f"[summarize] Total lines: {len(lines)}", flush=True)
-    updated = []
-    lines_summarized = 0
+        buf = f.read()
+    pending: List[Tuple[int, str]] = []
+    link_parts: Dict[int, str] = {}
+    replacements: Dict[int, str] = {}
+    spans: Dict[int, int] = {}
     max_calls = MAX_SUMMARIES
-    for i, line in enumerate(lines):
-        if line.startswith("- "):
-            message, _ = _split_link(line)
-            text = message[2:].strip()
-            if len(text) > args.max_chars:
-                print(f"[summarize] Summarizing line {i + 1}: {len(text)} -> {args.max_chars} chars", flush=True)
-                if lines_summarized >= max_calls:
-                    print(f"[summarize] Reached max summaries ({max_calls}), skipping the rest.", flush=True)
-                    updated.append(line)
-                    continue
-                lines_summarized += 1
-                updated.append(_summarize_line(line, args.max_chars))
-            else:
-                updated.append(line)
+    line_no, scanned = 1, 0
+    for match in _BULLET_RE.finditer(buf):
+        start = match.start()
+        message, link_part = _split_link(match.group())
+        text = message[2:].strip()
+        if len(text) <= args.max_chars:
+            continue
+        line_no += buf.count("\n", scanned, start)
+        scanned = start
+        local = _local_trim(text, args.max_chars)
+        if local is not None:
+            print(f"[summarize] Trimming line {line_no} locally: {len(text)} -> {args.max_chars} chars", flush=True)
+            replacements[start] = f"- {local}{link_part}"
         else:
-            updated.append(line)
+            print(f"[summarize] Summarizing line {line_no}: {len(text)} -> {args.max_chars} chars", flush=True)
+            if len(pending) >= max_calls:
+                print(f"[summarize] Reached max summaries ({max_calls}), skipping the rest.", flush=True)
+                continue
+            pending.append((start, text))
+            link_parts[start] = link_part
+        spans[start] = match.end()
+    total_lines = buf.count("\n") + (not buf.endswith("\n") and bool(buf))
+    print(f"[summarize] Total lines: {total_lines}", flush=True)
+    trimmed = len(replacements)
+
+    # One request per group of long lines; per-line calls only for what the batches missed
+    if pending:
+        # Threads only for work that can actually overlap; a single job runs inline
+        workers = min(CONCURRENCY, len(pending))
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            summaries: Dict[int, str] = {}
+            groups = _batch_groups(pending)
+            results = _run_all(executor, _call_github_models_batch, [(group, args.max_chars) for group in groups])
+            for group, result in zip(groups, results):
+                if isinstance(result, Exception):
+                    print(
+                        f"[summarize] Batch of {len(group)} failed: {result}. Falling back to per-line calls.",
+                        flush=True,
+                    )
+                else:
+                    summaries.update(result)
+            fallback: List[Tuple[int, str]] = []
+            for i, text in pending:
+                summary = summaries.get(i)
+                if summary:
+                    replacements[i] = f"- {_wrap_summary(summary)}{link_parts[i]}"
+                else:
+                    fallback.append((i, text))
+            results = _run_all(
+                executor, _summarize_precomputed, [(text, link_parts[i], args.max_chars) for i, text in fallback]
+            )
+            for (i, _), result in zip(fallback, results):
+                replacements[i] = "" if isinstance(result, Exception) else result
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    lines_summarized = len(pending) + trimmed
+    _close_cache()
 
     print(f"[summarize] Lines summarized: {lines_summarized}", flush=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(updated).rstrip() + "\n")
+    # Splice the summaries into the buffer and write it through a temp file replaced atomically.
+    # Trailing blank lines are dropped and the file ends with exactly one newline.
+    pieces: List[str] = []
+    pos = 0
+    for start in sorted(replacements):
+        if replacements[start]:
+            pieces.append(buf[pos:start])
+            pieces.append(replacements[start])
+            pos = spans[start]
+    pieces.append(buf[pos:])
+    while pieces and not pieces[-1].strip():
+        pieces.pop()
+    if pieces:
+        pieces[-1] = pieces[-1].rstrip()
+    pieces.append("\n")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fout:
+        fout.writelines(pieces)
+    os.replace(tmp_path, path)
     return 0
 
 
 if __name__ == "__main__":
-    # Track last call timestamp for rate limiting
-    _call_github_models._last_call = 0.0  # type: ignore[attr-defined]
     raise SystemExit(main())